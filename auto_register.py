@@ -15,13 +15,21 @@ Docker 컨테이너 및 호스트 프로세스 자동 감지 및 Uptime Kuma 모
 """
 
 import subprocess
+import functools
+import itertools
 import json
 import argparse
+import logging
+import random
 import re
+import shelve
 import shutil
 import signal
 import socket
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -29,17 +37,47 @@ from typing import Optional
 import os
 from dotenv import load_dotenv
 
-# 전역 변수: 종료 플래그
-_shutdown_requested = False
+# Docker SDK (선택 의존성) — 없으면 docker ps 서브프로세스 경로 사용
+try:
+    import docker as _docker_sdk
+except ImportError:
+    _docker_sdk = None
+
+# JSON 파서 (선택 의존성) — orjson이 있으면 C 구현으로 행 단위 파싱 가속
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# psutil (선택 의존성) — 호스트 프로세스 감지에만 필요. 기본 docker 전용
+# 경로가 import 비용을 지불하지 않도록 첫 사용 시점에 1회만 로드한다.
+@functools.lru_cache(maxsize=1)
+def _psutil():
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil
+
+# 종료 요청 이벤트 (signal 핸들러에서 set)
+_shutdown_event = threading.Event()
+
+# 모니터 단위 로그 (레벨 미달 시 포맷 비용 없음 — quiet 주기에 중요)
+log = logging.getLogger("auto_register")
 
 
+@functools.lru_cache(maxsize=1)
 def find_docker_executable() -> str:
-    """Docker 실행 파일 경로 찾기"""
+    """Docker 실행 파일 경로 찾기 (프로세스당 1회만 탐색)"""
     # 1. PATH에서 찾기
     docker_path = shutil.which("docker")
     if docker_path:
         return docker_path
 
+    # Windows가 아니면 기본 설치 경로 탐색이 의미 없으므로 바로 기본값
+    if os.name != "nt":
+        return "docker"
+
     # 2. Windows 기본 설치 경로들
     common_paths = [
         r"C:\Program Files\Docker\Docker\resources\bin\docker.exe",
@@ -71,6 +109,38 @@ FILTER_LABEL = os.getenv("FILTER_LABEL", "")
 # API 연결 Timeout (초)
 API_TIMEOUT = 10
 
+# 재연결 최대 시도 횟수 (watch 모드)
+RECONNECT_MAX_ATTEMPTS = 5
+
+# 연속 실패 시 백오프 대기 상한 (초)
+BACKOFF_MAX_DELAY = 3600
+
+# 로컬 모니터 상태 파일 및 서버 재동기화 주기 (watch 모드)
+KUMA_STATE_FILE = os.getenv("KUMA_STATE_FILE", "kuma_state.db")
+RECONCILE_INTERVAL = 10
+
+# 기본 제외 포트 (시스템 서비스)
+SYSTEM_EXCLUDE_PORTS = frozenset({22, 135, 139, 445, 3389, 5040, 7680})
+
+# socket.io emit 파이프라인 배치 크기 (등록/삭제)
+ADD_BATCH_SIZE = 16
+DELETE_BATCH_SIZE = 8
+
+# get_monitors 응답 캐시 TTL (초) — --list 직후 등록처럼 연속 호출 시 재사용
+MONITOR_CACHE_TTL = 30
+
+# Docker 포트 문자열 패턴 (CLI 폴백 경로 전용)
+# host_ip:host_port[-host_port]->container_port[-container_port]/protocol
+_PORT_RE = re.compile(
+    r"(?:(\d{1,3}(?:\.\d{1,3}){3}):)?(\d+)(?:-(\d+))?->(\d+)(?:-(\d+))?/(tcp|udp|sctp)"
+)
+
+# TCP 전용 포트 (데이터베이스, 캐시 등)
+TCP_ONLY_PORTS = frozenset({5432, 3306, 27017, 6379, 5379, 11211, 9042})
+
+# HTTP 서비스로 추정되는 포트
+HTTP_PORTS = frozenset({80, 443, 3000, 3001, 4000, 5000, 5001, 8000, 8080, 8096, 8443, 9000, 8920})
+
 
 @contextmanager
 def kuma_api_connection(timeout: int = API_TIMEOUT):
@@ -100,6 +170,108 @@ def kuma_api_connection(timeout: int = API_TIMEOUT):
         socket.setdefaulttimeout(old_timeout)
 
 
+def _tune_kuma_socket(api):
+    """장기 연결 소켓에 TCP_NODELAY / SO_KEEPALIVE 적용 (베스트 에포트)
+
+    engine.io 웹소켓 전송의 내부 소켓(api.sio.eio.ws.sock)에
+    접근하므로, 라이브러리 구조가 예상과 다르면 조용히 건너뛴다.
+    Nagle로 인한 소규모 emit 지연과 유휴 NAT 타임아웃으로 인한
+    무언의 연결 끊김을 방지한다.
+    """
+    try:
+        sio = api.sio
+        eio = getattr(sio, "eio", None)
+        ws = getattr(eio, "ws", None)
+        sock = getattr(ws, "sock", None)
+        if sock is None:
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except Exception:
+        pass
+
+
+class KumaSession:
+    """Uptime Kuma API 장기 연결 세션 (watch 모드용)
+
+    매 주기마다 WebSocket 연결 + 로그인을 반복하는 대신 하나의 연결을
+    watch 루프 수명 동안 유지하고, 끊어진 경우에만 지수 백오프로 재연결한다.
+    """
+
+    def __init__(self, timeout: int = API_TIMEOUT, max_attempts: int = RECONNECT_MAX_ATTEMPTS):
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self._api = None
+
+    def ensure_connected(self):
+        """연결 상태를 확인하고 API 인스턴스 반환 (필요 시 재연결)"""
+        if self._api is not None:
+            # socket.io 클라이언트의 connected 플래그로 검증 — info() 같은
+            # 조회는 connect 시점에 캐시된 이벤트 데이터를 돌려줄 뿐이라
+            # 끊어진 연결을 감지하지 못한다
+            sio = getattr(self._api, "sio", None)
+            if sio is not None and getattr(sio, "connected", False):
+                return self._api
+            self._drop()
+
+        from uptime_kuma_api import UptimeKumaApi
+
+        # 전역 소켓 타임아웃은 연결 시도 동안만 설정하고 복원
+        old_timeout = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(self.timeout)
+
+        last_error = None
+        try:
+            for attempt in range(self.max_attempts):
+                if attempt > 0:
+                    # 지수 백오프 (최대 30초) — 종료 요청 시 즉시 중단
+                    if _shutdown_event.wait(min(2 ** attempt, 30)):
+                        break
+                try:
+                    api = UptimeKumaApi(KUMA_URL)
+                    api.login(KUMA_USERNAME, KUMA_PASSWORD)
+                    # 주기 사이 유휴가 긴 장기 연결이므로 소켓 옵션 조정
+                    _tune_kuma_socket(api)
+                    self._api = api
+                    return api
+                except Exception as e:
+                    last_error = e
+                    self._drop()
+        finally:
+            socket.setdefaulttimeout(old_timeout)
+
+        raise ConnectionError(
+            f"Uptime Kuma connection failed after {self.max_attempts} attempts: {last_error}"
+        )
+
+    def _drop(self):
+        """현재 연결을 조용히 정리"""
+        if self._api is not None:
+            try:
+                self._api.disconnect()
+            except Exception:
+                pass
+            self._api = None
+
+    def disconnect(self):
+        """세션 종료 (watch 루프 종료 시 1회 호출)"""
+        self._drop()
+
+
+@contextmanager
+def _api_scope(session: Optional["KumaSession"] = None):
+    """세션이 있으면 재사용, 없으면 단발성 연결 생성
+
+    watch 모드에서는 KumaSession을 통해 연결을 재사용하고,
+    단일 실행 모드에서는 기존 kuma_api_connection 방식을 유지한다.
+    """
+    if session is not None:
+        yield session.ensure_connected()
+    else:
+        with kuma_api_connection() as api:
+            yield api
+
+
 @dataclass
 class ContainerInfo:
     """Docker 컨테이너 정보"""
@@ -110,6 +282,67 @@ class ContainerInfo:
     health: Optional[str] = None
 
 
+@dataclass
+class MonitorIndex:
+    """기존 모니터 이름 → ID 인덱스
+
+    api.get_monitors() 결과를 한 번만 순회해 구성하고, 같은 주기의
+    등록(이름 존재 확인)과 정리(이름 → ID 삭제)에서 공유한다.
+    """
+    by_name: dict[str, int]
+
+    @classmethod
+    def from_monitors(cls, monitors: list[dict]) -> "MonitorIndex":
+        return cls(by_name={m["name"]: m["id"] for m in monitors})
+
+
+class MonitorStore:
+    """모니터 {name: id} 매핑의 로컬 영속 캐시 (shelve 기반, watch 모드용)
+
+    매 주기 get_monitors()로 전체 모니터 목록을 전송받는 대신, 첫 연결 시
+    서버에서 1회 시드한 뒤 등록/삭제 결과의 diff만 반영한다. 드리프트
+    방지를 위해 reconcile_interval 주기마다 서버 목록으로 덮어쓴다.
+    """
+
+    def __init__(self, path: str = KUMA_STATE_FILE, reconcile_interval: int = RECONCILE_INTERVAL):
+        self.path = path
+        self.reconcile_interval = reconcile_interval
+        self._shelf = shelve.open(path)
+        # None이면 아직 서버에서 시드하지 않은 상태
+        self._cycles_since_sync = None
+
+    def index(self, api) -> MonitorIndex:
+        """현재 주기에 사용할 MonitorIndex 반환 (필요 시 서버 재동기화)"""
+        if (self._cycles_since_sync is None
+                or self._cycles_since_sync >= self.reconcile_interval):
+            self.reconcile(api)
+        else:
+            self._cycles_since_sync += 1
+        return MonitorIndex(by_name=dict(self._shelf))
+
+    def reconcile(self, api):
+        """서버 모니터 목록으로 로컬 상태 전체 덮어쓰기"""
+        monitors = api.get_monitors()
+        self._shelf.clear()
+        for m in monitors:
+            self._shelf[m["name"]] = m["id"]
+        self._shelf.sync()
+        self._cycles_since_sync = 0
+
+    def record_add(self, name: str, monitor_id):
+        """등록 성공 반영"""
+        self._shelf[name] = monitor_id
+
+    def record_delete(self, name: str):
+        """삭제 성공 반영"""
+        if name in self._shelf:
+            del self._shelf[name]
+
+    def close(self):
+        self._shelf.sync()
+        self._shelf.close()
+
+
 @dataclass
 class ProcessInfo:
     """호스트 프로세스 정보"""
@@ -120,26 +353,142 @@ class ProcessInfo:
     status: str = "running"
 
 
-def get_host_processes(exclude_ports: list[int] = None) -> list[ProcessInfo]:
+def _get_listeners_linux(exclude_ports: set) -> dict[int, int]:
+    """리눅스에서 /proc/net/tcp(6) 직접 파싱으로 {port: pid} 매핑 생성
+
+    psutil.net_connections는 모든 연결 상태의 소켓을 열거하지만,
+    여기서는 LISTEN 상태(st == 0A) 행만 한 번의 선형 읽기로 추출한 뒤
+    그 소수의 inode에 대해서만 /proc/*/fd를 스캔한다.
+    """
+    inode_to_port = {}
+
+    for path in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(path) as f:
+                next(f)  # 헤더 행 건너뛰기
+                for line in f:
+                    fields = line.split()
+                    # st(상태) 필드가 0A == LISTEN
+                    if len(fields) < 10 or fields[3] != "0A":
+                        continue
+                    port = int(fields[1].rsplit(":", 1)[1], 16)
+                    # 제외 포트는 파싱 단계에서 바로 거른다
+                    if port in exclude_ports:
+                        continue
+                    inode = int(fields[9])
+                    if inode:
+                        inode_to_port.setdefault(inode, port)
+        except OSError:
+            continue
+
+    if not inode_to_port:
+        return {}
+
+    # LISTEN 소켓 inode에 대해서만 inode → pid 역매핑
+    port_to_pid = {}
+    remaining = set(inode_to_port)
+    try:
+        proc_entries = list(os.scandir("/proc"))
+    except OSError:
+        return {}
+
+    for entry in proc_entries:
+        if not remaining:
+            break
+        if not entry.name.isdigit():
+            continue
+        try:
+            for fd in os.scandir(os.path.join(entry.path, "fd")):
+                try:
+                    target = os.readlink(fd.path)
+                except OSError:
+                    continue
+                if target.startswith("socket:["):
+                    inode = int(target[8:-1])
+                    if inode in remaining:
+                        port_to_pid[inode_to_port[inode]] = int(entry.name)
+                        remaining.discard(inode)
+                        if not remaining:
+                            break
+        except OSError:
+            continue
+
+    return port_to_pid
+
+
+def _resolve_process(pid: int, port: int, proc_cache: dict = None) -> Optional[ProcessInfo]:
+    """PID/포트로 ProcessInfo 생성 (프로세스 접근 불가 시 None)
+
+    proc_cache가 주어지면 같은 PID의 psutil.Process 객체를 재사용한다
+    (한 프로세스가 여러 포트를 리슨하는 경우 재생성 방지).
+    """
+    psutil = _psutil()
+    try:
+        if proc_cache is not None:
+            proc = proc_cache.get(pid)
+            if proc is None:
+                proc = psutil.Process(pid)
+                proc_cache[pid] = proc
+        else:
+            proc = psutil.Process(pid)
+
+        # oneshot으로 같은 프로세스에 대한 읽기를 한 번에 배치
+        with proc.oneshot():
+            name = proc.name()
+
+            # cmdline() 조회는 비싸므로 (리눅스 /proc 읽기, 윈도우 WMI 쿼리)
+            # 이름만으로 부족한 Python 프로세스에 대해서만 수행
+            cmdline = []
+            if 'python' in name.lower():
+                cmdline = proc.cmdline()
+                if len(cmdline) > 1:
+                    # Python 스크립트인 경우 스크립트 이름 사용
+                    name = f"python:{os.path.basename(cmdline[1])}"
+
+        return ProcessInfo(
+            name=name,
+            pid=pid,
+            port=port,
+            cmdline=cmdline,
+            status="running"
+        )
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def get_host_processes(exclude_ports: set[int] = None) -> list[ProcessInfo]:
     """호스트에서 실행 중인 리스닝 프로세스 목록 조회
 
     Args:
-        exclude_ports: 제외할 포트 목록 (기본: 시스템 포트)
+        exclude_ports: 제외할 포트 집합 (기본: 시스템 포트)
     """
-    try:
-        import psutil
-    except ImportError:
+    psutil = _psutil()
+    if psutil is None:
         print("[WARN] psutil library required for host process detection.")
         print("   Install: pip install psutil")
         return []
 
-    # 기본 제외 포트 (시스템 서비스)
-    if exclude_ports is None:
-        exclude_ports = [22, 135, 139, 445, 3389, 5040, 7680]
+    # O(1) 멤버십 검사를 위해 집합으로 고정
+    exclude = frozenset(exclude_ports) if exclude_ports is not None else SYSTEM_EXCLUDE_PORTS
 
     processes = []
-    seen_ports = set()
 
+    # PID별 psutil.Process 재사용 캐시 (다중 포트 리스너)
+    proc_cache: dict = {}
+
+    # Linux: /proc/net/tcp 직접 파싱 (전체 소켓 열거 회피)
+    if sys.platform.startswith("linux"):
+        for port, pid in sorted(_get_listeners_linux(exclude).items()):
+            # 1024 이하 시스템 포트 제외 (선택적)
+            if port < 1024:
+                continue
+            info = _resolve_process(pid, port, proc_cache)
+            if info is not None:
+                processes.append(info)
+        return processes
+
+    # 기타 플랫폼: psutil 경로
+    seen_ports = set()
     try:
         for conn in psutil.net_connections(kind='inet'):
             if conn.status != 'LISTEN':
@@ -148,7 +497,7 @@ def get_host_processes(exclude_ports: list[int] = None) -> list[ProcessInfo]:
             port = conn.laddr.port
 
             # 제외 포트 및 중복 체크
-            if port in exclude_ports or port in seen_ports:
+            if port in exclude or port in seen_ports:
                 continue
 
             # 1024 이하 시스템 포트 제외 (선택적)
@@ -157,26 +506,9 @@ def get_host_processes(exclude_ports: list[int] = None) -> list[ProcessInfo]:
 
             seen_ports.add(port)
 
-            try:
-                proc = psutil.Process(conn.pid)
-                cmdline = proc.cmdline()
-
-                # 프로세스 이름 결정
-                name = proc.name()
-                if 'python' in name.lower() and len(cmdline) > 1:
-                    # Python 스크립트인 경우 스크립트 이름 사용
-                    script = os.path.basename(cmdline[1]) if len(cmdline) > 1 else name
-                    name = f"python:{script}"
-
-                processes.append(ProcessInfo(
-                    name=name,
-                    pid=conn.pid,
-                    port=port,
-                    cmdline=cmdline,
-                    status="running"
-                ))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+            info = _resolve_process(conn.pid, port, proc_cache)
+            if info is not None:
+                processes.append(info)
 
     except psutil.AccessDenied:
         print("[WARN] Access denied. Run as administrator for full process list.")
@@ -184,48 +516,267 @@ def get_host_processes(exclude_ports: list[int] = None) -> list[ProcessInfo]:
     return processes
 
 
+# Docker Engine API 클라이언트 싱글턴 (UNIX 소켓/npipe 연결 재사용)
+_docker_api_client = None
+_docker_api_failed = False
+
+
+def _get_docker_api_client():
+    """Docker 저수준 APIClient 싱글턴 반환 (SDK 없거나 연결 실패 시 None)
+
+    CLI fork+exec 대신 데몬과 UNIX 소켓(/var/run/docker.sock) 또는
+    Windows npipe로 직접 통신한다. 연결은 프로세스 수명 동안 재사용.
+    """
+    global _docker_api_client, _docker_api_failed
+    if _docker_sdk is None or _docker_api_failed:
+        return None
+    if _docker_api_client is None:
+        try:
+            _docker_api_client = _docker_sdk.from_env().api
+        except Exception as e:
+            log.debug("Docker Engine API unavailable: %s", e)
+            _docker_api_failed = True
+            return None
+    return _docker_api_client
+
+
+def _health_from_status(status: str) -> Optional[str]:
+    """docker ps Status 문자열에서 health 상태 추출"""
+    if "(healthy)" in status:
+        return "healthy"
+    if "(unhealthy)" in status:
+        return "unhealthy"
+    if "(health:" in status:
+        return "starting"
+    return None
+
+
+def _container_info_from_engine(data: dict) -> ContainerInfo:
+    """Engine API /containers/json 항목을 ContainerInfo로 변환
+
+    Ports가 이미 구조화된 목록({IP, PrivatePort, PublicPort, Type})으로
+    오므로 문자열 파싱 없이 매핑만 한다.
+    """
+    names = data.get("Names") or []
+    name = names[0].lstrip("/") if names else ""
+    status = data.get("Status", "")
+
+    ports = []
+    seen = set()
+    for p in data.get("Ports") or []:
+        public = p.get("PublicPort")
+        # 호스트에 공개되지 않은 포트는 모니터링 대상 아님
+        if public is None:
+            continue
+        host_ip = p.get("IP") or "0.0.0.0"
+        # IPv6 바인딩 중복 제거 (IPv4만)
+        if ":" in host_ip:
+            continue
+        key = (host_ip, public, p.get("PrivatePort"), p.get("Type"))
+        if key in seen:
+            continue
+        seen.add(key)
+        ports.append({
+            "host_ip": host_ip,
+            "host_port": public,
+            "container_port": p.get("PrivatePort"),
+            "protocol": p.get("Type")
+        })
+
+    return ContainerInfo(
+        name=name,
+        image=data.get("Image", ""),
+        ports=ports,
+        status=status,
+        health=_health_from_status(status)
+    )
+
+
+def _get_containers_engine_api(filter_label: str) -> Optional[list[ContainerInfo]]:
+    """Engine API /containers/json으로 컨테이너 목록 조회
+
+    실패(또는 SDK 부재) 시 None을 반환해 호출자가 CLI 경로로 폴백한다.
+    """
+    client = _get_docker_api_client()
+    if client is None:
+        return None
+
+    filters = {"label": [filter_label]} if filter_label else None
+    try:
+        raw = client.containers(filters=filters)
+    except Exception as e:
+        log.debug("Engine API container listing failed: %s", e)
+        return None
+
+    return [_container_info_from_engine(data) for data in raw]
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_available() -> bool:
+    """Docker 사용 가능 여부 (프로세스당 1회만 판정)
+
+    SDK가 있거나 docker 실행 파일이 실제로 존재하면 True. 없으면
+    watch 주기마다 실패할 서브프로세스를 띄우지 않도록 스캔을 건너뛴다.
+    """
+    if _docker_sdk is not None:
+        return True
+    docker_cmd = find_docker_executable()
+    if os.path.sep in docker_cmd or (os.path.altsep and os.path.altsep in docker_cmd):
+        return os.path.exists(docker_cmd)
+    return shutil.which(docker_cmd) is not None
+
+
+def _matches_label(labels: dict, filter_label: str) -> bool:
+    """컨테이너 라벨이 필터와 일치하는지 확인 ("key" 또는 "key=value" 형식)"""
+    if not filter_label:
+        return True
+    key, sep, value = filter_label.partition("=")
+    if key not in labels:
+        return False
+    return not sep or labels.get(key) == value
+
+
+class ContainerCache:
+    """Docker 이벤트 기반 컨테이너 캐시 (watch 모드용)
+
+    매 주기 docker ps 서브프로세스를 띄우는 대신, 시작 시 컨테이너
+    목록을 1회 조회해 캐시를 만들고 이후에는 Docker 이벤트 스트림을
+    백그라운드 스레드로 소비하면서 start/die 이벤트로 캐시를 갱신한다.
+    Docker SDK가 없으면 사용할 수 없다 (available 확인).
+    """
+
+    def __init__(self, label_filter: str = None):
+        self.label_filter = label_filter or FILTER_LABEL
+        self._client = None
+        self._containers: dict[str, ContainerInfo] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def available() -> bool:
+        """Docker SDK 사용 가능 여부"""
+        return _docker_sdk is not None
+
+    def start(self):
+        """초기 스냅샷 조회 후 이벤트 소비 스레드 시작"""
+        self._client = _docker_sdk.from_env()
+        self._refresh()
+        self._thread = threading.Thread(target=self._consume_events, daemon=True)
+        self._thread.start()
+
+    def _refresh(self):
+        """전체 컨테이너 목록으로 캐시 재구성
+
+        저수준 /containers/json 호출 1회로 구조화된 Ports까지 받으므로
+        컨테이너별 inspect 왕복이나 포트 문자열 파싱이 없다.
+        """
+        filters = {"label": [self.label_filter]} if self.label_filter else None
+        snapshot = {}
+        for data in self._client.api.containers(filters=filters):
+            snapshot[data["Id"]] = _container_info_from_engine(data)
+        with self._lock:
+            self._containers = snapshot
+
+    def _consume_events(self):
+        """컨테이너 start/die 이벤트로 캐시 증분 갱신 (백그라운드 스레드)"""
+        while not self._stop.is_set():
+            try:
+                for event in self._client.events(decode=True, filters={"type": "container"}):
+                    if self._stop.is_set():
+                        return
+                    status = event.get("status")
+                    container_id = event.get("id")
+                    if status == "start":
+                        try:
+                            matches = self._client.api.containers(
+                                filters={"id": [container_id]}
+                            )
+                        except Exception:
+                            continue
+                        if not matches:
+                            continue
+                        data = matches[0]
+                        if not _matches_label(data.get("Labels") or {}, self.label_filter):
+                            continue
+                        info = _container_info_from_engine(data)
+                        with self._lock:
+                            self._containers[container_id] = info
+                    elif status in ("die", "destroy"):
+                        with self._lock:
+                            self._containers.pop(container_id, None)
+            except Exception:
+                # 이벤트 스트림 끊김 — 잠시 후 전체 스냅샷으로 복구
+                if self._stop.wait(5):
+                    return
+                try:
+                    self._refresh()
+                except Exception:
+                    pass
+
+    def snapshot(self) -> list[ContainerInfo]:
+        """현재 캐시된 컨테이너 목록 반환"""
+        with self._lock:
+            return list(self._containers.values())
+
+    def stop(self):
+        """이벤트 소비 중단 및 클라이언트 정리"""
+        self._stop.set()
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+
+
 def get_docker_containers(label_filter: str = None) -> list[ContainerInfo]:
     """실행 중인 Docker 컨테이너 목록 조회
 
     Args:
         label_filter: 라벨 필터 (예: "monitor.project=side_monitor")
     """
+    filter_label = label_filter or FILTER_LABEL
+
+    # Engine API 경로: CLI fork+exec 없이 데몬과 직접 통신
+    containers = _get_containers_engine_api(filter_label)
+    if containers is not None:
+        return containers
+
+    if not _docker_available():
+        log.debug("Docker not available - skipping container scan")
+        return []
+
     try:
         docker_cmd = find_docker_executable()
         cmd = [docker_cmd, "ps", "--format", "{{json .}}"]
 
         # 라벨 필터 적용
-        filter_label = label_filter or FILTER_LABEL
         if filter_label:
             cmd.extend(["--filter", f"label={filter_label}"])
 
-        result = subprocess.run(
+        # 전체 출력을 버퍼링하지 않고 행 단위로 스트리밍 파싱
+        # (파싱이 docker CLI 출력 생성과 겹쳐 수행되고 피크 메모리도 일정)
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             encoding="utf-8",
             errors="replace"
         )
 
         containers = []
-        for line in result.stdout.strip().split("\n"):
+        for line in proc.stdout:
+            line = line.strip()
             if not line:
                 continue
-            data = json.loads(line)
+            data = _json_loads(line)
 
             # 포트 파싱
             ports = parse_ports(data.get("Ports", ""))
 
             # health 상태 추출
             status = data.get("Status", "")
-            health = None
-            if "(healthy)" in status:
-                health = "healthy"
-            elif "(unhealthy)" in status:
-                health = "unhealthy"
-            elif "(health:" in status:
-                health = "starting"
+            health = _health_from_status(status)
 
             containers.append(ContainerInfo(
                 name=data.get("Names", ""),
@@ -235,11 +786,17 @@ def get_docker_containers(label_filter: str = None) -> list[ContainerInfo]:
                 health=health
             ))
 
+        stderr = proc.stderr.read()
+        proc.wait()
+        if proc.returncode != 0:
+            print(f"Error running docker ps: exit code {proc.returncode}")
+            if stderr:
+                print(f"  Detail: {stderr.strip()}")
+            return []
+
         return containers
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print(f"Error running docker ps: {e}")
-        if e.stderr:
-            print(f"  Detail: {e.stderr.strip()}")
         return []
 
 
@@ -252,28 +809,77 @@ def parse_ports(ports_str: str) -> list[dict]:
     if not ports_str:
         return ports
 
-    # 패턴: host_ip:host_port->container_port/protocol
-    pattern = r"(?:(\d+\.\d+\.\d+\.\d+):)?(\d+)->(\d+)/(\w+)"
+    # 중복 제거용 (IPv4만) — 리스트 멤버십 대신 O(1) 집합 검사
+    seen = set()
 
-    for match in re.finditer(pattern, ports_str):
+    for match in _PORT_RE.finditer(ports_str):
         host_ip = match.group(1) or "0.0.0.0"
-        host_port = int(match.group(2))
-        container_port = int(match.group(3))
-        protocol = match.group(4)
+        host_start = int(match.group(2))
+        host_end = int(match.group(3)) if match.group(3) else host_start
+        container_start = int(match.group(4))
+        protocol = match.group(6)
+
+        # 범위 형식("9092-9093->9092-9093/tcp")은 포트별로 전개
+        for offset in range(host_end - host_start + 1):
+            key = (host_ip, host_start + offset, container_start + offset, protocol)
+            if key in seen:
+                continue
+            seen.add(key)
 
-        # 중복 제거 (IPv4만)
-        port_info = {
-            "host_ip": host_ip,
-            "host_port": host_port,
-            "container_port": container_port,
-            "protocol": protocol
-        }
-        if port_info not in ports:
-            ports.append(port_info)
+            ports.append({
+                "host_ip": host_ip,
+                "host_port": host_start + offset,
+                "container_port": container_start + offset,
+                "protocol": protocol
+            })
 
     return ports
 
 
+# 모니터 설정 템플릿 — 상수 필드는 한 번만 구성하고 .copy()로 복제한다
+# (accepted_statuscodes 리스트는 읽기 전용이므로 모든 모니터가 공유)
+_HTTP_TEMPLATE = {
+    "type": "http",
+    "method": "GET",
+    "interval": 60,
+    "retryInterval": 60,
+    "maxretries": 3,
+    "accepted_statuscodes": ["200-299", "300-399"],
+}
+_TCP_TEMPLATE = {
+    "type": "port",
+    "interval": 60,
+    "retryInterval": 60,
+    "maxretries": 3,
+}
+
+
+def _build_monitor(name_prefix: str, name: str, port: int, target_host: str) -> dict:
+    """서비스 이름/포트로 모니터 설정 생성 (컨테이너/프로세스 공용)
+
+    TCP 전용 포트는 TCP 모니터, HTTP 추정 포트(및 3000 이상)는 HTTP
+    모니터, 그 외는 TCP 모니터로 분류한다.
+    """
+    # HTTP 모니터
+    if port not in TCP_ONLY_PORTS and (port in HTTP_PORTS or port >= 3000):
+        monitor = _HTTP_TEMPLATE.copy()
+        monitor["name"] = f"{name_prefix}{name}:{port}"
+
+        # API/백엔드 서비스는 /health 엔드포인트 시도
+        lowered = name.lower()
+        path = "/health" if "api" in lowered or "backend" in lowered else ""
+        monitor["url"] = f"http://{target_host}:{port}{path}"
+
+        return monitor
+
+    # TCP 모니터 (데이터베이스/캐시 및 기타 포트)
+    monitor = _TCP_TEMPLATE.copy()
+    monitor["name"] = f"{name_prefix}{name}:{port} (TCP)"
+    monitor["hostname"] = target_host
+    monitor["port"] = port
+    return monitor
+
+
 def generate_monitor_config(container: ContainerInfo, host: str = None) -> list[dict]:
     """컨테이너 정보로 모니터 설정 생성
 
@@ -281,63 +887,13 @@ def generate_monitor_config(container: ContainerInfo, host: str = None) -> list[
         container: Docker 컨테이너 정보
         host: 모니터링 대상 호스트 (기본값: DOCKER_HOST_IP 환경변수 또는 localhost)
     """
-    monitors = []
     target_host = host or DOCKER_HOST_IP
 
-    # TCP 전용 포트 (데이터베이스, 캐시 등)
-    tcp_only_ports = [5432, 3306, 27017, 6379, 5379, 11211, 9042]
-
-    # HTTP 서비스로 추정되는 포트
-    http_ports = [80, 443, 3000, 3001, 4000, 5000, 5001, 8000, 8080, 8096, 8443, 9000, 8920]
-
-    for port in container.ports:
-        if port["protocol"] != "tcp":
-            continue
-
-        host_port = port["host_port"]
-
-        # TCP 전용 포트는 TCP 모니터로
-        if host_port in tcp_only_ports:
-            monitors.append({
-                "type": "port",
-                "name": f"{container.name}:{host_port} (TCP)",
-                "hostname": target_host,
-                "port": host_port,
-                "interval": 60,
-                "retryInterval": 60,
-                "maxretries": 3,
-            })
-        elif host_port in http_ports or host_port >= 3000:
-            # HTTP 모니터
-            monitor = {
-                "type": "http",
-                "name": f"{container.name}:{host_port}",
-                "url": f"http://{target_host}:{host_port}",
-                "method": "GET",
-                "interval": 60,
-                "retryInterval": 60,
-                "maxretries": 3,
-                "accepted_statuscodes": ["200-299", "300-399"],
-            }
-
-            # health 엔드포인트 추가 시도
-            if "api" in container.name.lower() or "backend" in container.name.lower():
-                monitor["url"] = f"http://{target_host}:{host_port}/health"
-
-            monitors.append(monitor)
-        else:
-            # 기타 포트는 TCP 모니터
-            monitors.append({
-                "type": "port",
-                "name": f"{container.name}:{host_port} (TCP)",
-                "hostname": target_host,
-                "port": host_port,
-                "interval": 60,
-                "retryInterval": 60,
-                "maxretries": 3,
-            })
-
-    return monitors
+    return [
+        _build_monitor("", container.name, port["host_port"], target_host)
+        for port in container.ports
+        if port["protocol"] == "tcp"
+    ]
 
 
 def generate_monitor_config_for_process(process: ProcessInfo, host: str = None) -> dict:
@@ -348,59 +904,21 @@ def generate_monitor_config_for_process(process: ProcessInfo, host: str = None)
         host: 모니터링 대상 호스트
     """
     target_host = host or DOCKER_HOST_IP
+    return _build_monitor("[Host] ", process.name, process.port, target_host)
 
-    # TCP 전용 포트 (데이터베이스, 캐시 등)
-    tcp_only_ports = [5432, 3306, 27017, 6379, 5379, 11211, 9042]
-
-    # HTTP 서비스로 추정되는 포트
-    http_ports = [80, 443, 3000, 3001, 4000, 5000, 5001, 8000, 8080, 8096, 8443, 9000, 8920]
-
-    port = process.port
-
-    if port in tcp_only_ports:
-        return {
-            "type": "port",
-            "name": f"[Host] {process.name}:{port} (TCP)",
-            "hostname": target_host,
-            "port": port,
-            "interval": 60,
-            "retryInterval": 60,
-            "maxretries": 3,
-        }
-    elif port in http_ports or port >= 3000:
-        monitor = {
-            "type": "http",
-            "name": f"[Host] {process.name}:{port}",
-            "url": f"http://{target_host}:{port}",
-            "method": "GET",
-            "interval": 60,
-            "retryInterval": 60,
-            "maxretries": 3,
-            "accepted_statuscodes": ["200-299", "300-399"],
-        }
-
-        # API/백엔드 프로세스는 /health 엔드포인트 시도
-        if "api" in process.name.lower() or "backend" in process.name.lower():
-            monitor["url"] = f"http://{target_host}:{port}/health"
 
-        return monitor
-    else:
-        return {
-            "type": "port",
-            "name": f"[Host] {process.name}:{port} (TCP)",
-            "hostname": target_host,
-            "port": port,
-            "interval": 60,
-            "retryInterval": 60,
-            "maxretries": 3,
-        }
+def _print_block(lines: list[str]):
+    """버퍼링된 출력 행을 단일 write로 방출
+
+    항목당 print를 반복하면 행마다 stdout 잠금/flush가 발생한다
+    (특히 Windows 콘솔에서 느림) — 한 번에 join하여 내보낸다.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_container_summary(containers: list[ContainerInfo]):
     """컨테이너 요약 출력"""
-    print("\n" + "=" * 60)
-    print("Running Docker Containers")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, "Running Docker Containers", "=" * 60]
 
     for c in containers:
         health_icon = {
@@ -410,102 +928,254 @@ def print_container_summary(containers: list[ContainerInfo]):
             None: "[--]"
         }.get(c.health, "[--]")
 
-        print(f"\n{health_icon} {c.name}")
-        print(f"   Image: {c.image}")
-        print(f"   Status: {c.status}")
+        lines.append(f"\n{health_icon} {c.name}")
+        lines.append(f"   Image: {c.image}")
+        lines.append(f"   Status: {c.status}")
 
         if c.ports:
             ports_str = ", ".join([f"{p['host_port']}" for p in c.ports])
-            print(f"   Ports: {ports_str}")
+            lines.append(f"   Ports: {ports_str}")
+
+    _print_block(lines)
 
 
 def print_process_summary(processes: list[ProcessInfo]):
     """호스트 프로세스 요약 출력"""
-    print("\n" + "=" * 60)
-    print("Running Host Processes")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, "Running Host Processes", "=" * 60]
 
     for p in processes:
-        print(f"\n[HOST] {p.name}")
-        print(f"   PID: {p.pid}")
-        print(f"   Port: {p.port}")
+        lines.append(f"\n[HOST] {p.name}")
+        lines.append(f"   PID: {p.pid}")
+        lines.append(f"   Port: {p.port}")
         if p.cmdline:
             cmd_str = " ".join(p.cmdline[:3])
             if len(p.cmdline) > 3:
                 cmd_str += " ..."
-            print(f"   Cmd: {cmd_str}")
+            lines.append(f"   Cmd: {cmd_str}")
+
+    _print_block(lines)
 
 
 def print_monitors_to_create(monitors: list[dict]):
     """생성할 모니터 목록 출력"""
-    print("\n" + "=" * 60)
-    print("Monitors to Create in Uptime Kuma")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, "Monitors to Create in Uptime Kuma", "=" * 60]
 
     for m in monitors:
         type_icon = "[HTTP]" if m["type"] == "http" else "[TCP]"
         url = m.get("url") or f"{m.get('hostname')}:{m.get('port')}"
-        print(f"\n{type_icon} {m['name']}")
-        print(f"   Type: {m['type'].upper()}")
-        print(f"   URL: {url}")
-        print(f"   Interval: {m['interval']}s")
+        lines.append(f"\n{type_icon} {m['name']}")
+        lines.append(f"   Type: {m['type'].upper()}")
+        lines.append(f"   URL: {url}")
+        lines.append(f"   Interval: {m['interval']}s")
+
+    _print_block(lines)
+
+
+# get_monitors() 결과 캐시: (KUMA_URL, 사용자명) → (조회 시각, 모니터 목록)
+# 전체 모니터 테이블 직렬화는 Kuma 쪽에서 비싼 왕복이므로 TTL 내 재사용한다
+_monitor_cache: dict[tuple, tuple[float, list[dict]]] = {}
+
+
+def _monitor_cache_key() -> tuple:
+    return (KUMA_URL, KUMA_USERNAME)
+
+
+def _cached_monitors(api, ttl: int = MONITOR_CACHE_TTL) -> list[dict]:
+    """TTL 내에서 api.get_monitors() 결과 재사용"""
+    key = _monitor_cache_key()
+    entry = _monitor_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    monitors = api.get_monitors()
+    _monitor_cache[key] = (now, monitors)
+    return monitors
+
+
+def _monitor_cache_add(monitor: dict, monitor_id=None):
+    """등록 성공 직후 캐시를 제자리 갱신 — 재조회 왕복 없이 최신 유지
+
+    캐시 항목은 get_monitors() 응답과 같은 모양이어야 하므로
+    (MonitorIndex가 "id" 키를 요구) 서버가 돌려준 id를 함께 기록하고,
+    id를 알 수 없으면 항목을 추가하는 대신 캐시를 무효화한다.
+    """
+    if monitor_id is None:
+        _monitor_cache_invalidate()
+        return
+    entry = _monitor_cache.get(_monitor_cache_key())
+    if entry is not None:
+        entry[1].append({**monitor, "id": monitor_id, "active": True})
+
+
+def _monitor_cache_invalidate():
+    """삭제 등 제자리 갱신이 어려운 변경 후 캐시 무효화"""
+    _monitor_cache.pop(_monitor_cache_key(), None)
+
+
+def _monitor_api_kwargs(m: dict, MonitorType) -> dict:
+    """모니터 설정 dict를 add_monitor 인자 dict로 변환"""
+    if m["type"] == "http":
+        return dict(
+            type=MonitorType.HTTP,
+            name=m["name"],
+            url=m["url"],
+            method=m.get("method", "GET"),
+            interval=m["interval"],
+            retryInterval=m.get("retryInterval", 60),
+            maxretries=m.get("maxretries", 3),
+            accepted_statuscodes=m.get("accepted_statuscodes", ["200-299"]),
+        )
+    return dict(
+        type=MonitorType.PORT,
+        name=m["name"],
+        hostname=m["hostname"],
+        port=m["port"],
+        interval=m["interval"],
+        retryInterval=m.get("retryInterval", 60),
+        maxretries=m.get("maxretries", 3),
+    )
+
+
+def _emit_batched(api, event: str, payloads: list, max_in_flight: int) -> list:
+    """socket.io emit을 ack 대기 없이 파이프라인 전송 (슬라이딩 윈도우)
+
+    호출당 왕복을 기다리는 api._call 대신 최대 max_in_flight개의 emit을
+    미결 상태로 유지한다: ack가 도착할 때마다 윈도우가 열려 다음 emit이
+    나가므로, 배치 장벽 방식과 달리 파이프라인이 끊기지 않는다 (서버는
+    emit을 순서대로 처리). ack 응답을 payload 순서대로 반환한다.
+    """
+    # uptime-kuma-api의 socket.io 클라이언트 접근 (api.sio)
+    sio = getattr(api, "sio", None)
+    if sio is None:
+        raise AttributeError("socket.io client not accessible")
+
+    results = [None] * len(payloads)
+    window = threading.Semaphore(max_in_flight)
+    acks = []
+
+    for i, payload in enumerate(payloads):
+        if not window.acquire(timeout=API_TIMEOUT * max(1, max_in_flight)):
+            raise TimeoutError(f"emit window stalled for '{event}'")
 
+        done = threading.Event()
 
-def register_monitors_with_api(api, monitors: list[dict], quiet: bool = False) -> int:
+        def _callback(response=None, _done=done, _i=i):
+            results[_i] = response
+            _done.set()
+            window.release()
+
+        sio.emit(event, payload, callback=_callback)
+        acks.append(done)
+
+    # 잔여 ack 도착 대기
+    for done in acks:
+        if not done.wait(API_TIMEOUT * max(1, max_in_flight)):
+            raise TimeoutError(f"no ack for pipelined '{event}' emit")
+
+    return results
+
+
+def _register_monitors_pipelined(
+    api,
+    new_monitors: list[dict],
+    store: Optional[MonitorStore] = None
+) -> int:
+    """emit 파이프라인으로 신규 모니터 일괄 등록
+
+    uptime-kuma-api 내부 구조(_build_monitor_data/sio)가 예상과 다르면
+    AttributeError/TypeError가 발생하고 호출자가 순차 경로로 폴백한다.
+    payload 구성은 emit 이전에 모두 끝나므로 폴백 시 중복 전송은 없다.
+    """
+    from uptime_kuma_api import MonitorType
+
+    # add_monitor와 동일한 정규화/검증 경로를 거친 payload 구성
+    # (_build_monitor_data만으로는 입력 변환/인자 검증이 빠진다)
+    build = api._build_monitor_data
+    try:
+        from uptime_kuma_api.api import _check_arguments_monitor, _convert_monitor_input
+    except ImportError:
+        _convert_monitor_input = getattr(api, "_convert_monitor_input", None)
+        _check_arguments_monitor = None
+
+    payloads = []
+    for m in new_monitors:
+        data = build(**_monitor_api_kwargs(m, MonitorType))
+        if _convert_monitor_input is not None:
+            data = _convert_monitor_input(data) or data
+        if _check_arguments_monitor is not None:
+            _check_arguments_monitor(data)
+        payloads.append(data)
+
+    results = _emit_batched(api, "add", payloads, ADD_BATCH_SIZE)
+
+    created = 0
+    for m, response in zip(new_monitors, results):
+        if isinstance(response, dict) and response.get("ok"):
+            log.info("[OK] Created: %s", m["name"])
+            if store is not None:
+                store.record_add(m["name"], response.get("monitorID"))
+            _monitor_cache_add(m, response.get("monitorID"))
+            created += 1
+        else:
+            msg = response.get("msg") if isinstance(response, dict) else response
+            log.warning("[FAIL] %s - %s", m["name"], msg)
+    return created
+
+
+def register_monitors_with_api(
+    api,
+    monitors: list[dict],
+    index: MonitorIndex = None,
+    quiet: bool = False,
+    store: Optional[MonitorStore] = None
+) -> int:
     """API 연결을 사용하여 모니터 등록 (단일 연결 재사용)
 
     Args:
         api: UptimeKumaApi 인스턴스 (이미 로그인됨)
         monitors: 등록할 모니터 설정 목록
+        index: 미리 구성한 기존 모니터 인덱스 (없으면 직접 조회)
         quiet: 출력 최소화
+        store: 로컬 모니터 상태 저장소 (등록 성공 시 갱신)
 
     Returns:
         등록된 모니터 수
     """
     from uptime_kuma_api import MonitorType
 
-    # 기존 모니터 목록 조회
-    existing = api.get_monitors()
-    existing_names = {m["name"] for m in existing}
+    # 기존 모니터 인덱스 (호출자가 전달하지 않은 경우에만 조회)
+    if index is None:
+        index = MonitorIndex.from_monitors(_cached_monitors(api))
+    existing_names = index.by_name
 
-    created = 0
+    new_monitors = []
     skipped = 0
-
     for m in monitors:
-        if m["name"] in existing_names:
-            if not quiet:
-                print(f"[SKIP] Already exists: {m['name']}")
+        name = m["name"]
+        if name in existing_names:
+            log.info("[SKIP] Already exists: %s", name)
             skipped += 1
-            continue
+        else:
+            new_monitors.append(m)
 
+    created = 0
+    if new_monitors:
         try:
-            if m["type"] == "http":
-                api.add_monitor(
-                    type=MonitorType.HTTP,
-                    name=m["name"],
-                    url=m["url"],
-                    method=m.get("method", "GET"),
-                    interval=m["interval"],
-                    retryInterval=m.get("retryInterval", 60),
-                    maxretries=m.get("maxretries", 3),
-                    accepted_statuscodes=m.get("accepted_statuscodes", ["200-299"]),
-                )
-            else:
-                api.add_monitor(
-                    type=MonitorType.PORT,
-                    name=m["name"],
-                    hostname=m["hostname"],
-                    port=m["port"],
-                    interval=m["interval"],
-                    retryInterval=m.get("retryInterval", 60),
-                    maxretries=m.get("maxretries", 3),
-                )
-            if not quiet:
-                print(f"[OK] Created: {m['name']}")
-            created += 1
-        except Exception as e:
-            if not quiet:
-                print(f"[FAIL] {m['name']} - {e}")
+            # 파이프라인 경로: emit 배치로 왕복 지연 상쇄
+            created = _register_monitors_pipelined(api, new_monitors, store=store)
+        except (AttributeError, TypeError):
+            # 내부 API 접근 불가 — 호출당 왕복하는 순차 등록으로 폴백
+            for m in new_monitors:
+                try:
+                    response = api.add_monitor(**_monitor_api_kwargs(m, MonitorType))
+                    log.info("[OK] Created: %s", m["name"])
+                    monitor_id = response.get("monitorID") if isinstance(response, dict) else None
+                    if store is not None:
+                        store.record_add(m["name"], monitor_id)
+                    _monitor_cache_add(m, monitor_id)
+                    created += 1
+                except Exception as e:
+                    log.warning("[FAIL] %s - %s", m["name"], e)
 
     if not quiet:
         print(f"\nResult: {created} created, {skipped} skipped")
@@ -517,7 +1187,7 @@ def list_existing_monitors():
     """기존 모니터 목록 출력"""
     try:
         with kuma_api_connection() as api:
-            monitors = api.get_monitors()
+            monitors = _cached_monitors(api)
 
             print("\n" + "=" * 60)
             print(f"Uptime Kuma Registered Monitors ({len(monitors)})")
@@ -539,27 +1209,51 @@ def list_existing_monitors():
         print(f"[ERROR] Failed to connect: {e}")
 
 
+# Docker 컨테이너 이름에 허용되는 문자 (자동 등록 패턴 판별용)
+_DOCKER_NAME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+
+
 def is_auto_registered_monitor(name: str) -> bool:
     """자동 등록된 모니터인지 확인 (이름 패턴으로 판단)
 
     자동 등록 패턴:
     - Docker: "{container_name}:{port}" 또는 "{container_name}:{port} (TCP)"
     - Host: "[Host] {process_name}:{port}" 또는 "[Host] {process_name}:{port} (TCP)"
+
+    수천 개 모니터를 대상으로 주기마다 호출되므로 정규식 대신
+    문자열 접두/접미 검사로 판별한다.
     """
-    import re
-    # Docker 컨테이너 패턴: name:port 또는 name:port (TCP)
-    docker_pattern = r"^[a-zA-Z0-9_-]+:\d+( \(TCP\))?$"
-    # 호스트 프로세스 패턴: [Host] name:port 또는 [Host] name:port (TCP)
-    host_pattern = r"^\[Host\] .+:\d+( \(TCP\))?$"
+    if name.startswith("[Host] "):
+        core = name[7:]
+        is_host = True
+    else:
+        core = name
+        is_host = False
+
+    if core.endswith(" (TCP)"):
+        core = core[:-6]
 
-    return bool(re.match(docker_pattern, name) or re.match(host_pattern, name))
+    idx = core.rfind(":")
+    if idx <= 0:
+        return False
+    if not core[idx + 1:].isdigit():
+        return False
+
+    # 호스트 프로세스 이름은 임의 문자열, Docker 이름은 영숫자/_/-만 허용
+    if is_host:
+        return True
+    return set(core[:idx]) <= _DOCKER_NAME_CHARS
 
 
 def cleanup_offline_monitors_with_api(
     api,
     active_monitor_names: set[str],
+    index: MonitorIndex = None,
     dry_run: bool = False,
-    quiet: bool = False
+    quiet: bool = False,
+    store: Optional[MonitorStore] = None
 ) -> int:
     """API 연결을 사용하여 오프라인 모니터 삭제 (단일 연결 재사용)
 
@@ -570,13 +1264,16 @@ def cleanup_offline_monitors_with_api(
     Args:
         api: UptimeKumaApi 인스턴스 (이미 로그인됨)
         active_monitor_names: 현재 실행 중인 모니터 이름 집합
+        index: 미리 구성한 기존 모니터 인덱스 (없으면 직접 조회)
         dry_run: 미리보기 모드
         quiet: 출력 최소화
+        store: 로컬 모니터 상태 저장소 (삭제 성공 시 갱신)
 
     Returns:
         삭제된 모니터 수
     """
-    existing = api.get_monitors()
+    if index is None:
+        index = MonitorIndex.from_monitors(api.get_monitors())
     deleted = 0
 
     # heartbeat 정보 가져오기 (모니터 상태 확인용)
@@ -585,49 +1282,63 @@ def cleanup_offline_monitors_with_api(
     except Exception:
         heartbeats = {}
 
-    for m in existing:
-        name = m["name"]
-        monitor_id = m["id"]
+    # 삭제 대상 수집 (RPC는 수집이 끝난 뒤 일괄 수행)
+    to_delete = []
 
+    for name, monitor_id in index.by_name.items():
         # 자동 등록된 모니터만 대상으로 함
         if not is_auto_registered_monitor(name):
             continue
 
-        # 삭제 조건 확인
-        should_delete = False
-        reason = ""
-
         # 조건 1: 프로세스가 더 이상 실행되지 않음
         if name not in active_monitor_names:
-            should_delete = True
-            reason = "process not running"
-        else:
-            # 조건 2: Uptime Kuma에서 다운 상태 (heartbeat 확인)
-            monitor_heartbeats = heartbeats.get(monitor_id, [])
-            if monitor_heartbeats:
-                # 최근 heartbeat 상태 확인 (status: 0=down, 1=up)
-                latest = monitor_heartbeats[0] if monitor_heartbeats else None
-                if latest and latest.get("status") == 0:
-                    should_delete = True
-                    reason = "down in Uptime Kuma"
-
-        if not should_delete:
+            to_delete.append((name, monitor_id, "process not running"))
             continue
 
-        # 오프라인 모니터 삭제
-        if dry_run:
-            if not quiet:
-                print(f"[DRY-RUN] Would delete: {name} ({reason})")
+        # 조건 2: Uptime Kuma에서 다운 상태 (heartbeat 확인)
+        monitor_heartbeats = heartbeats.get(monitor_id, [])
+        if monitor_heartbeats:
+            # 최근 heartbeat 상태 확인 (status: 0=down, 1=up)
+            latest = monitor_heartbeats[0]
+            if latest and latest.get("status") == 0:
+                to_delete.append((name, monitor_id, "down in Uptime Kuma"))
+
+    # 오프라인 모니터 삭제
+    if dry_run:
+        for name, monitor_id, reason in to_delete:
+            log.info("[DRY-RUN] Would delete: %s (%s)", name, reason)
             deleted += 1
-        else:
-            try:
-                api.delete_monitor(monitor_id)
-                if not quiet:
-                    print(f"[DELETED] {name} ({reason})")
-                deleted += 1
-            except Exception as e:
-                if not quiet:
-                    print(f"[FAIL] Delete {name} - {e}")
+    elif to_delete:
+        try:
+            # 파이프라인 경로: emit 배치로 삭제 왕복 상쇄
+            results = _emit_batched(
+                api, "deleteMonitor",
+                [monitor_id for _, monitor_id, _ in to_delete],
+                DELETE_BATCH_SIZE
+            )
+            for (name, monitor_id, reason), response in zip(to_delete, results):
+                if isinstance(response, dict) and not response.get("ok", True):
+                    log.warning("[FAIL] Delete %s - %s", name, response.get("msg"))
+                else:
+                    log.info("[DELETED] %s (%s)", name, reason)
+                    if store is not None:
+                        store.record_delete(name)
+                    deleted += 1
+        except (AttributeError, TypeError):
+            # 내부 API 접근 불가 — 순차 삭제로 폴백
+            for name, monitor_id, reason in to_delete:
+                try:
+                    api.delete_monitor(monitor_id)
+                    log.info("[DELETED] %s (%s)", name, reason)
+                    if store is not None:
+                        store.record_delete(name)
+                    deleted += 1
+                except Exception as e:
+                    log.warning("[FAIL] Delete %s - %s", name, e)
+
+    # 삭제는 캐시 제자리 갱신이 번거로우므로 (id 기준) 통째로 무효화
+    if deleted > 0 and not dry_run:
+        _monitor_cache_invalidate()
 
     if deleted > 0 and not quiet:
         print(f"\nCleanup: {deleted} offline monitor(s) {'would be ' if dry_run else ''}removed")
@@ -635,6 +1346,19 @@ def cleanup_offline_monitors_with_api(
     return deleted
 
 
+def _cleanup_skippable(state: Optional[dict], active_hash: int, registered: int) -> bool:
+    """직전 주기와 활성 모니터 집합이 같고 신규 등록도 없으면 True
+
+    watch 모드 정상 상태에서는 대부분의 주기에 변화가 없으므로,
+    이 경우 cleanup의 get_monitors 왕복 전체를 생략할 수 있다.
+    """
+    return (
+        state is not None
+        and registered == 0
+        and state.get("last_active_hash") == active_hash
+    )
+
+
 def scan_and_register(
     target_host: str,
     include_host: bool = False,
@@ -643,7 +1367,11 @@ def scan_and_register(
     dry_run: bool = False,
     quiet: bool = False,
     auto_cleanup: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[KumaSession] = None,
+    container_cache: Optional[ContainerCache] = None,
+    state: Optional[dict] = None,
+    store: Optional[MonitorStore] = None
 ) -> tuple[int, int]:
     """컨테이너/프로세스 스캔 및 모니터 등록
 
@@ -655,40 +1383,59 @@ def scan_and_register(
         dry_run: 미리보기 모드
         quiet: 출력 최소화 (watch 모드용)
         auto_cleanup: 오프라인 모니터 자동 삭제
+        session: 재사용할 Uptime Kuma 세션 (watch 모드용, 없으면 단발성 연결)
+        container_cache: 이벤트 기반 컨테이너 캐시 (없으면 docker ps 실행)
+        state: watch 모드 주기 간 상태 dict (no-op 주기의 cleanup 생략용)
+        store: 로컬 모니터 상태 저장소 (주기당 get_monitors 왕복 제거용)
 
     Returns:
         (등록된 모니터 수, 삭제된 모니터 수) 튜플
     """
-    all_monitors = []
     containers = []
     processes = []
 
-    # Docker 컨테이너 조회 (--host-only가 아닌 경우)
-    if not host_only:
-        containers = get_docker_containers(label_filter=label_filter)
-        if containers and not quiet:
-            print_container_summary(containers)
-        for c in containers:
-            monitors = generate_monitor_config(c, host=target_host)
-            all_monitors.extend(monitors)
-
-    # 호스트 프로세스 조회 (--include-host 또는 --host-only인 경우)
-    if include_host or host_only:
-        # Docker 컨테이너가 사용 중인 포트 제외
-        docker_ports = []
-        for c in containers:
-            for p in c.ports:
-                docker_ports.append(p["host_port"])
-
-        processes = get_host_processes(exclude_ports=docker_ports + [22, 135, 139, 445, 3389, 5040, 7680])
-        if processes and not quiet:
-            print_process_summary(processes)
-        for p in processes:
-            monitor = generate_monitor_config_for_process(p, host=target_host)
-            all_monitors.append(monitor)
-
-    # 현재 활성 모니터 이름 집합 (cleanup용)
-    active_monitor_names = {m["name"] for m in all_monitors}
+    scan_docker = not host_only
+    scan_host = include_host or host_only
+
+    # Docker/호스트 스캔은 모두 I/O 바운드 (서브프로세스 + 시스템 콜)
+    # — 둘 다 필요한 경우 동시에 실행하여 주기 지연을 max()로 줄인다
+    if scan_docker and scan_host:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if container_cache is not None:
+                docker_future = pool.submit(container_cache.snapshot)
+            else:
+                docker_future = pool.submit(get_docker_containers, label_filter)
+            host_future = pool.submit(get_host_processes, SYSTEM_EXCLUDE_PORTS)
+            containers = docker_future.result()
+            processes = host_future.result()
+
+        # Docker 컨테이너가 점유한 포트는 집합 차로 사후 제거
+        docker_ports = {p["host_port"] for c in containers for p in c.ports}
+        processes = [p for p in processes if p.port not in docker_ports]
+    elif scan_docker:
+        if container_cache is not None:
+            containers = container_cache.snapshot()
+        else:
+            containers = get_docker_containers(label_filter=label_filter)
+    elif scan_host:
+        processes = get_host_processes(exclude_ports=SYSTEM_EXCLUDE_PORTS)
+
+    if containers and not quiet:
+        print_container_summary(containers)
+    if processes and not quiet:
+        print_process_summary(processes)
+
+    # 모니터 설정은 단일 체인 패스로 생성 — 소스별 중간 리스트 없이
+    # 컨테이너/프로세스 순회와 설정 변환을 한 번에 수행한다
+    all_monitors = list(itertools.chain(
+        itertools.chain.from_iterable(
+            generate_monitor_config(c, host=target_host) for c in containers
+        ),
+        (generate_monitor_config_for_process(p, host=target_host) for p in processes),
+    ))
+
+    # 현재 활성 모니터 이름 집합 (cleanup이 켜진 경우에만 구성)
+    active_monitor_names = {m["name"] for m in all_monitors} if auto_cleanup else None
 
     if not containers and not processes:
         if not quiet:
@@ -696,17 +1443,32 @@ def scan_and_register(
         # cleanup만 수행 (컨테이너/프로세스가 없어도 기존 모니터 정리)
         deleted = 0
         if auto_cleanup:
-            try:
-                with kuma_api_connection() as api:
-                    deleted = cleanup_offline_monitors_with_api(
-                        api,
-                        active_monitor_names=set(),
-                        dry_run=dry_run,
-                        quiet=quiet
-                    )
-            except Exception as e:
+            active_hash = hash(frozenset())
+            if _cleanup_skippable(state, active_hash, 0):
                 if not quiet:
-                    print(f"[ERROR] Cleanup failed: {e}")
+                    print("[INFO] No changes since last cycle - cleanup skipped")
+            else:
+                try:
+                    with _api_scope(session) as api:
+                        # 비어 있는 스캔에서도 로컬 저장소 인덱스를 재사용하고
+                        # 삭제 결과를 기록 (다음 주기의 doomed delete 방지)
+                        index = store.index(api) if store is not None else None
+                        deleted = cleanup_offline_monitors_with_api(
+                            api,
+                            active_monitor_names=set(),
+                            index=index,
+                            dry_run=dry_run,
+                            quiet=quiet,
+                            store=store
+                        )
+                    if state is not None:
+                        state["last_active_hash"] = active_hash
+                except Exception as e:
+                    # watch 모드에서는 호출자(watch_loop)가 백오프로 처리
+                    if session is not None:
+                        raise
+                    if not quiet:
+                        print(f"[ERROR] Cleanup failed: {e}")
         return (0, deleted)
 
     if not quiet:
@@ -730,48 +1492,87 @@ def scan_and_register(
             print("\n[DRY-RUN] No actual registration performed.")
         # dry-run cleanup
         if auto_cleanup:
-            if not quiet:
-                print("\n" + "=" * 60)
-                print("Cleaning up offline monitors...")
-                print("=" * 60)
-            try:
-                with kuma_api_connection() as api:
-                    deleted = cleanup_offline_monitors_with_api(
-                        api,
-                        active_monitor_names=active_monitor_names,
-                        dry_run=True,
-                        quiet=quiet
-                    )
-            except Exception as e:
+            active_hash = hash(frozenset(active_monitor_names))
+            if _cleanup_skippable(state, active_hash, 0):
+                if not quiet:
+                    print("[INFO] No changes since last cycle - cleanup skipped")
+            else:
                 if not quiet:
-                    print(f"[ERROR] Cleanup failed: {e}")
+                    print("\n" + "=" * 60)
+                    print("Cleaning up offline monitors...")
+                    print("=" * 60)
+                try:
+                    with _api_scope(session) as api:
+                        deleted = cleanup_offline_monitors_with_api(
+                            api,
+                            active_monitor_names=active_monitor_names,
+                            dry_run=True,
+                            quiet=quiet
+                        )
+                    if state is not None:
+                        state["last_active_hash"] = active_hash
+                except Exception as e:
+                    # watch 모드에서는 호출자(watch_loop)가 백오프로 처리
+                    if session is not None:
+                        raise
+                    if not quiet:
+                        print(f"[ERROR] Cleanup failed: {e}")
     else:
         # 실제 등록 + cleanup (단일 연결)
         try:
-            with kuma_api_connection() as api:
+            with _api_scope(session) as api:
+                # 기존 모니터 인덱스는 주기당 1회만 구성 (등록/정리 공유)
+                # — 로컬 저장소가 있으면 주기적 재동기화 외에는 서버 왕복 없음
+                if store is not None:
+                    index = store.index(api)
+                else:
+                    # TTL 캐시 경유: 같은 프로세스의 연속 주기(저장소 없는
+                    # watch 모드 등)는 30초 내 재조회를 생략한다. 등록은
+                    # 캐시에 제자리 반영되고 정리는 캐시를 무효화하므로,
+                    # 외부에서 변경된 모니터만 TTL만큼 늦게 보일 수 있다
+                    # (중복 등록 시도는 서버가 거부하고 [FAIL]로 기록됨)
+                    index = MonitorIndex.from_monitors(_cached_monitors(api))
+
                 if not quiet:
                     print("\n" + "=" * 60)
                     print("Registering monitors to Uptime Kuma...")
                     print("=" * 60)
-                registered = register_monitors_with_api(api, all_monitors, quiet=quiet)
+                registered = register_monitors_with_api(
+                    api, all_monitors, index=index, quiet=quiet, store=store
+                )
 
                 # 오프라인 모니터 정리 (동일 연결 재사용)
                 if auto_cleanup:
-                    if not quiet:
-                        print("\n" + "=" * 60)
-                        print("Cleaning up offline monitors...")
-                        print("=" * 60)
-                    deleted = cleanup_offline_monitors_with_api(
-                        api,
-                        active_monitor_names=active_monitor_names,
-                        dry_run=False,
-                        quiet=quiet
-                    )
+                    active_hash = hash(frozenset(active_monitor_names))
+                    if _cleanup_skippable(state, active_hash, registered):
+                        if not quiet:
+                            print("[INFO] No changes since last cycle - cleanup skipped")
+                    else:
+                        if not quiet:
+                            print("\n" + "=" * 60)
+                            print("Cleaning up offline monitors...")
+                            print("=" * 60)
+                        deleted = cleanup_offline_monitors_with_api(
+                            api,
+                            active_monitor_names=active_monitor_names,
+                            index=index,
+                            dry_run=False,
+                            quiet=quiet,
+                            store=store
+                        )
+                        if state is not None:
+                            state["last_active_hash"] = active_hash
         except ImportError:
+            if session is not None:
+                raise
             if not quiet:
                 print("[WARN] uptime-kuma-api library required.")
                 print("   Install: pip install uptime-kuma-api")
         except Exception as e:
+            # watch 모드에서는 삼켜버리면 백오프가 영영 발동하지 않는다
+            # — 호출자(watch_loop)의 연속 실패 처리로 전파
+            if session is not None:
+                raise
             if not quiet:
                 print(f"[ERROR] API connection failed: {e}")
 
@@ -780,8 +1581,7 @@ def scan_and_register(
 
 def _signal_handler(signum, frame):
     """시그널 핸들러 (graceful shutdown)"""
-    global _shutdown_requested
-    _shutdown_requested = True
+    _shutdown_event.set()
     print("\n[INFO] Shutdown requested. Finishing current cycle...")
 
 
@@ -807,8 +1607,6 @@ def watch_loop(
         auto_cleanup: 오프라인 모니터 자동 삭제
         verbose: 상세 디버그 출력
     """
-    global _shutdown_requested
-
     # 시그널 핸들러 등록 (Windows에서는 SIGINT만 지원)
     signal.signal(signal.SIGINT, _signal_handler)
     if hasattr(signal, 'SIGTERM'):
@@ -828,36 +1626,89 @@ def watch_loop(
         print("  Mode: DRY-RUN (no actual registration/deletion)")
     print("\nPress Ctrl+C to stop.\n")
 
-    cycle = 0
-    while not _shutdown_requested:
-        cycle += 1
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # 루프 수명 동안 재사용할 단일 API 세션 (연결은 첫 사용 시 수립)
+    session = KumaSession()
 
-        print(f"\n[{timestamp}] Cycle #{cycle} - Scanning...")
+    # 주기 간 상태 (직전 주기의 활성 모니터 해시 등)
+    state = {}
 
+    # 로컬 모니터 상태 저장소 — 매 주기 get_monitors 전송을 생략하고
+    # RECONCILE_INTERVAL 주기마다만 서버와 재동기화
+    store = None
+    if not dry_run:
         try:
-            registered, deleted = scan_and_register(
-                target_host=target_host,
-                include_host=include_host,
-                host_only=host_only,
-                label_filter=label_filter,
-                dry_run=dry_run,
-                quiet=not verbose,  # verbose 모드에서는 상세 출력
-                verbose=verbose,
-                auto_cleanup=auto_cleanup
-            )
-            status = f"registered: {registered}"
-            if auto_cleanup:
-                status += f", deleted: {deleted}"
-            print(f"[{timestamp}] Cycle #{cycle} - Done. {status}")
+            store = MonitorStore()
+            print(f"[INFO] Using local monitor state: {store.path}")
         except Exception as e:
-            print(f"[{timestamp}] Cycle #{cycle} - Error: {e}")
+            print(f"[WARN] Local monitor state unavailable: {e}")
+
+    # Docker SDK가 있으면 이벤트 기반 캐시로 docker ps 반복 실행 제거
+    container_cache = None
+    if not host_only and ContainerCache.available():
+        cache = ContainerCache(label_filter=label_filter)
+        try:
+            cache.start()
+            container_cache = cache
+            print("[INFO] Using Docker event stream (no per-cycle docker ps)")
+        except Exception as e:
+            print(f"[WARN] Docker event stream unavailable, falling back to docker ps: {e}")
+
+    cycle = 0
+    consecutive_failures = 0
+    try:
+        while not _shutdown_event.is_set():
+            cycle += 1
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # 종료 요청 확인하면서 대기
-        for _ in range(interval):
-            if _shutdown_requested:
+            print(f"\n[{timestamp}] Cycle #{cycle} - Scanning...")
+
+            # 정상 상태 주기는 WARNING으로 낮춰 모니터 단위 로그의
+            # 포맷 비용 자체를 제거 (첫 주기/실패 직후 주기는 INFO)
+            if not verbose:
+                steady = cycle > 1 and consecutive_failures == 0
+                log.setLevel(logging.WARNING if steady else logging.INFO)
+
+            delay = interval
+            try:
+                registered, deleted = scan_and_register(
+                    target_host=target_host,
+                    include_host=include_host,
+                    host_only=host_only,
+                    label_filter=label_filter,
+                    dry_run=dry_run,
+                    quiet=not verbose,  # verbose 모드에서는 상세 출력
+                    verbose=verbose,
+                    auto_cleanup=auto_cleanup,
+                    session=session,
+                    container_cache=container_cache,
+                    state=state,
+                    store=store
+                )
+                consecutive_failures = 0
+                status = f"registered: {registered}"
+                if auto_cleanup:
+                    status += f", deleted: {deleted}"
+                print(f"[{timestamp}] Cycle #{cycle} - Done. {status}")
+            except Exception as e:
+                # 연속 실패 시 지수 백오프 + 지터로 다음 주기를 늦춘다
+                # (장애 중인 Kuma를 같은 주기로 계속 때리지 않도록)
+                consecutive_failures += 1
+                # 실패한 연결은 버려서 다음 ensure_connected가 재로그인하도록
+                session.disconnect()
+                delay = min(interval * (2 ** consecutive_failures), BACKOFF_MAX_DELAY)
+                delay += random.uniform(0, interval * 0.1)
+                print(f"[{timestamp}] Cycle #{cycle} - Error: {e} (next scan in {delay:.0f}s)")
+
+            # 다음 주기까지 대기 (종료 요청 시 즉시 반환)
+            if _shutdown_event.wait(delay):
                 break
-            time.sleep(1)
+    finally:
+        # 종료 시 연결/캐시/저장소 1회만 정리
+        session.disconnect()
+        if container_cache is not None:
+            container_cache.stop()
+        if store is not None:
+            store.close()
 
     print("\n" + "=" * 60)
     print("Watch Mode Stopped")
@@ -886,6 +1737,14 @@ def main():
                         help="상세 디버그 출력")
     args = parser.parse_args()
 
+    # 모니터 단위 메시지는 logging 경유 (레벨 미달 시 포맷 비용 없음)
+    # — print 기반 요약과 같은 스트림(stdout)으로 내보내 순서를 보존
+    logging.basicConfig(
+        format="%(message)s",
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        stream=sys.stdout
+    )
+
     if args.list:
         list_existing_monitors()
         return